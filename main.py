@@ -12,45 +12,62 @@ If you find this useful, please consider giving credit by linking to my GitHub p
 You're free to modify and redistribute this without any restrictions.
 """
 
+import concurrent.futures
+import functools
+import http.client
 import json
 import os
 import shutil
+import socket
 import subprocess
 import sys
+import threading
+import time
+import urllib.error
+import urllib.request
 import uuid
 from datetime import datetime
 
 import psutil
 import minecraft_launcher_lib
 
-from PySide6.QtCore import QObject, Qt, QThread, QSize, Signal
+from PySide6.QtCore import QObject, QRunnable, Qt, QThread, QThreadPool, QSize, QTimer, QUrl, Signal
 from PySide6.QtWidgets import (
     QApplication, QComboBox, QDialog, QDialogButtonBox, QFileDialog, QFrame,
     QGridLayout, QHBoxLayout, QLabel, QLineEdit, QMessageBox,
     QProgressBar, QPushButton, QSlider, QSpinBox, QTextEdit,
     QVBoxLayout, QWidget
 )
-from PySide6.QtGui import QIcon, QPainter, QPixmap
+from PySide6.QtGui import QDesktopServices, QIcon, QPainter, QPixmap
 
 
 class BackgroundWidget(QWidget):
     def __init__(self, pixmap, parent=None):
         super().__init__(parent)
         self.pixmap = pixmap
+        self._scaled = None
 
     def paintEvent(self, event):
+        if self._scaled is None or self._scaled.size() != self.size():
+            self._scaled = self.pixmap.scaled(self.size(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        painter.drawPixmap(self.rect(), self.pixmap)
+        painter.drawPixmap(0, 0, self._scaled)
 
 
 def get_appdata_path():
     return os.path.join(os.getenv("APPDATA"), "AsphaltLauncher")
 
 
+_BASE_PATH = getattr(sys, '_MEIPASS', os.path.dirname(__file__))
+
+
 def resource_path(relative_path):
-    base_path = getattr(sys, '_MEIPASS', os.path.dirname(__file__))
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
+
+
+@functools.lru_cache(maxsize=16)
+def _icon(relative_path):
+    return QIcon(resource_path(relative_path))
 
 
 def get_minecraft_dir():
@@ -60,6 +77,15 @@ def get_minecraft_dir():
 CONFIG_FILE = os.path.join(get_appdata_path(), "launcher.json")
 
 
+def _file_key(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+_CFG_LOCK = threading.Lock()
+_CFG_SEQ = {"next": 0, "written": 0}
+
+
 def load_config():
     if os.path.isfile(CONFIG_FILE):
         try:
@@ -70,23 +96,47 @@ def load_config():
     return {"username": "", "jvm_args": ["-Xms2G", "-Xmx4G"], "java_path": None}
 
 
-def save_config(username, jvm_args, java_path):
+def _next_config_seq():
+    with _CFG_LOCK:
+        _CFG_SEQ["next"] += 1
+        return _CFG_SEQ["next"]
+
+
+def save_config(username, jvm_args, java_path, seq=None):
+    if seq is None:
+        seq = _next_config_seq()
     os.makedirs(get_appdata_path(), exist_ok=True)
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump({"username": username, "jvm_args": jvm_args, "java_path": java_path}, f, indent=2)
+    data = {"username": username, "jvm_args": jvm_args, "java_path": java_path}
+    with _CFG_LOCK:
+        if seq < _CFG_SEQ["written"]:
+            return
+        tmp_file = CONFIG_FILE + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_file, CONFIG_FILE)
+        _CFG_SEQ["written"] = seq
 
 
 LAST_PLAYED_FILE = os.path.join(get_appdata_path(), "last_played.json")
 
 
+_LAST_PLAYED_CACHE = {"key": None, "data": None}
+
+
 def load_last_played():
-    if os.path.isfile(LAST_PLAYED_FILE):
-        try:
-            with open(LAST_PLAYED_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {}
+    try:
+        key = _file_key(LAST_PLAYED_FILE)
+    except OSError:
+        return {}
+    if key == _LAST_PLAYED_CACHE["key"]:
+        return dict(_LAST_PLAYED_CACHE["data"])
+    try:
+        with open(LAST_PLAYED_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        _LAST_PLAYED_CACHE["key"], _LAST_PLAYED_CACHE["data"] = key, data
+        return dict(data)
+    except Exception:
+        return {}
 
 
 def save_last_played(version_id):
@@ -94,50 +144,120 @@ def save_last_played(version_id):
     lp[version_id] = datetime.now().timestamp()
     with open(LAST_PLAYED_FILE, "w", encoding="utf-8") as f:
         json.dump(lp, f, indent=2)
+    _LAST_PLAYED_CACHE["key"], _LAST_PLAYED_CACHE["data"] = _file_key(LAST_PLAYED_FILE), lp
+
+
+VERSIONS_CACHE_FILE = os.path.join(get_appdata_path(), "versions_cache.json")
+VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+VERSIONS_CACHE_TTL = 600
+
+
+def _load_versions_cache():
+    if os.path.isfile(VERSIONS_CACHE_FILE):
+        try:
+            with open(VERSIONS_CACHE_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            pass
+    return None
+
+
+def _save_versions_cache(cache):
+    try:
+        os.makedirs(get_appdata_path(), exist_ok=True)
+        with open(VERSIONS_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _cached_remote_versions():
+    cache = _load_versions_cache()
+    if not cache or cache.get("data") is None:
+        cache = None
+    elif time.time() - cache.get("fetched_at", 0) < VERSIONS_CACHE_TTL:
+        return cache["data"]
+
+    req = urllib.request.Request(VERSION_MANIFEST_URL)
+    if cache:
+        if cache.get("etag"):
+            req.add_header("If-None-Match", cache["etag"])
+        if cache.get("last_modified"):
+            req.add_header("If-Modified-Since", cache["last_modified"])
+
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            manifest = json.load(resp)
+            headers = resp.headers
+        data = [{"id": v["id"], "type": v["type"]} for v in manifest["versions"]]
+    except (OSError, ValueError, KeyError, TypeError, http.client.HTTPException) as e:
+        if not cache:
+            raise
+        if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+            cache["fetched_at"] = time.time()
+            _save_versions_cache(cache)
+        return cache["data"]
+
+    cache = {
+        "fetched_at": time.time(),
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "data": data,
+    }
+    _save_versions_cache(cache)
+    return cache["data"]
 
 
 def _scan_local_versions():
-    local = {}
     versions_dir = os.path.join(get_minecraft_dir(), "versions")
-    if os.path.isdir(versions_dir):
-        for name in os.listdir(versions_dir):
-            folder = os.path.join(versions_dir, name)
-            if os.path.isdir(folder):
-                local[name] = os.path.getmtime(folder)
-    return local
-
-
-def get_available_versions():
-    local = _scan_local_versions()
-    local_items = [(f"🔧 {v}", v) for v in local]
-    remote = minecraft_launcher_lib.utils.get_version_list()
-    type_labels = {"release": "Release", "snapshot": "Snapshot", "old_beta": "Beta", "old_alpha": "Alpha"}
-    seen = set(local)
-    remote_items = []
-    
-    for v in remote:
-        vid = v["id"]
-        if vid in seen:
-            continue
-        seen.add(vid)
-        label = f"{type_labels.get(v['type'], v['type'])} - {vid}"
-        remote_items.append((label, vid))
-    
-    items = local_items + remote_items
-    last_played = load_last_played()
-    
-    if last_played:
-        last_vid = max(last_played, key=last_played.get)
-        idx = next((i for i, (_, vid) in enumerate(items) if vid == last_vid), None)
-        if idx is not None:
-            items.insert(0, items.pop(idx))
-    
-    return items
+    try:
+        with os.scandir(versions_dir) as it:
+            return {e.name: e.stat().st_mtime for e in it if e.is_dir(follow_symlinks=False)}
+    except OSError:
+        return {}
+
+
+VERSION_TYPE_PREFIXES = {
+    "release": "Release - ", "snapshot": "Snapshot - ",
+    "old_beta": "Beta - ", "old_alpha": "Alpha - ",
+}
+
+
+def _remote_items(remote, seen):
+    prefixes = VERSION_TYPE_PREFIXES
+    return [((prefixes.get(v["type"]) or v["type"] + " - ") + v["id"], v["id"])
+            for v in remote if v["id"] not in seen]
+
+
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+
+@functools.lru_cache(maxsize=32)
+def _offline_uuid(username):
+    return str(uuid.uuid3(uuid.NAMESPACE_OID, username))
+
+
+_INSTALL_STATE_CACHE = {}
+
+
+def _is_installed(mc_dir, version_id):
+    version_dir = os.path.join(mc_dir, "versions", version_id)
+    try:
+        mtime = os.stat(version_dir).st_mtime
+        cached = _INSTALL_STATE_CACHE.get(version_dir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with os.scandir(version_dir) as it:
+            names = {e.name for e in it if e.is_file()}
+    except OSError:
+        return False
+    installed = f"{version_id}.json" in names and f"{version_id}.jar" in names
+    _INSTALL_STATE_CACHE[version_dir] = (mtime, installed)
+    return installed
 
 
-def launch_minecraft(username, version, java_executable=None, jvm_args=None):
-    offline_uuid = str(uuid.uuid3(uuid.NAMESPACE_OID, username))
-    options = {"username": username, "uuid": offline_uuid, "token": "0" * 32}
+def launch_minecraft(username, version, java_executable=None, jvm_args=None, install_if_missing=True):
+    options = {"username": username, "uuid": _offline_uuid(username), "token": "0" * 32}
     
     if java_executable:
         options["executablePath"] = java_executable
@@ -145,7 +265,8 @@ def launch_minecraft(username, version, java_executable=None, jvm_args=None):
         options["jvmArguments"] = jvm_args
     
     mc_dir = get_minecraft_dir()
-    minecraft_launcher_lib.install.install_minecraft_version(version, mc_dir, callback=None)
+    if install_if_missing and not _is_installed(mc_dir, version):
+        minecraft_launcher_lib.install.install_minecraft_version(version, mc_dir, callback=None)
     command = minecraft_launcher_lib.command.get_minecraft_command(version, mc_dir, options)
     
     proc = subprocess.Popen(
@@ -157,15 +278,82 @@ def launch_minecraft(username, version, java_executable=None, jvm_args=None):
     save_last_played(version)
     proc.wait()
     
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+    threading.Thread(target=_cleanup_stale_launchers, daemon=True).start()
+
+
+def _cleanup_stale_launchers():
+    own_pid = os.getpid()
+    for proc in psutil.process_iter(['pid']):
         try:
-            if proc.info['pid'] != os.getpid():
-                if "asphalt-launcher" in ' '.join(proc.info['cmdline']).lower():
+            if proc.info['pid'] != own_pid:
+                if "asphalt-launcher" in ' '.join(proc.cmdline()).lower():
                     proc.terminate()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
 
 
+def _split_xms_xmx(args):
+    xms = xmx = None
+    other = []
+    for arg in args:
+        flag = arg[:4]
+        if flag == "-Xms" or flag == "-Xmx":
+            mb = int(arg[4:-1]) if arg.endswith("M") else int(arg[4:-1]) * 1024
+            if flag == "-Xms":
+                xms = mb
+            else:
+                xmx = mb
+        else:
+            other.append(arg)
+    return xms, xmx, other
+
+
+_CREDITS_HTML = (
+    "<strong>Asphalt Launcher - A Launcher for Minecraft</strong><br>"
+    "An open-source and minimal Minecraft launcher built using Python<br><br>"
+    '<a href="https://github.com/arsalanvally/Asphalt-Launcher">GitHub</a> • '
+    '<a href="https://github.com/arsalanvally/Asphalt-Launcher/blob/main/README.md">README</a> • '
+    '<a href="https://github.com/arsalanvally/Asphalt-Launcher/blob/main/LICENSE">LICENSE</a> • '
+    '<a href="https://github.com/arsalanvally/Asphalt-Launcher/blob/main/BUILD.md">BUILD</a> • '
+    '<a href="https://github.com/arsalanvally/Asphalt-Launcher/blob/main/FAQ.md">FAQ</a><br><br>'
+    "If you find this useful, <strong>please consider giving credit</strong> by linking to my GitHub page—"
+    "it's not required, but it would be <strong>greatly appreciated.</strong><br>"
+    "You're <strong>free</strong> to <strong>modify</strong> and <strong>redistribute</strong> this <strong>without</strong> any <strong>restrictions.</strong>"
+)
+
+
+NETWORK_CHECK_INTERVAL = 3000
+NETWORK_CHECK_MAX_INTERVAL = 60000
+NETWORK_PROBE_CACHE_SECS = 2.5
+
+
+_DARK_BTN_QSS = """
+    QPushButton#darkBtn {
+        background: rgba(0, 0, 0, 120);
+        color: #ffffff;
+        font-weight: bold;
+        border: none;
+        border-radius: 4px;
+        padding: 8px;
+    }
+    QPushButton#darkBtn:hover {
+        background: rgba(0, 0, 0, 160);
+    }
+    QPushButton#darkBtn:pressed {
+        background: rgba(0, 0, 0, 200);
+    }
+"""
+
+_ACCOUNT_DLG_QSS = (
+    "* { font-family: 'Segoe UI'; font-size: 12px; }"
+    + _DARK_BTN_QSS
+    + "QPushButton#darkBtn { padding: 6px; }"
+)
+
+
+PROGRESS_EMIT_INTERVAL = 1 / 30
+
+
 class JvmArgsDialog(QDialog):
     def __init__(self, parent=None, current=None):
         super().__init__(parent)
@@ -232,11 +420,21 @@ class InstallWorker(QObject):
         super().__init__()
         self.version_id = version_id
         self.mc_dir = mc_dir
+        self._max = 0
+        self._last_emit = 0.0
 
     def run(self):
         try:
-            def cb_max(v): self.progress_max.emit(v)
-            def cb_prog(v): self.progress.emit(v)
+            def cb_max(v):
+                if v != self._max:
+                    self._max = v
+                    self.progress_max.emit(v)
+
+            def cb_prog(v):
+                now = time.monotonic()
+                if now - self._last_emit >= PROGRESS_EMIT_INTERVAL or 0 < self._max <= v:
+                    self._last_emit = now
+                    self.progress.emit(v)
             
             minecraft_launcher_lib.install.install_minecraft_version(
                 self.version_id, self.mc_dir,
@@ -247,18 +445,54 @@ class InstallWorker(QObject):
             self.failed.emit(str(e))
 
 
+class NetworkProbeSignals(QObject):
+    result = Signal(bool)
+
+
+class NetworkProbe(QRunnable):
+    def __init__(self):
+        super().__init__()
+        self.signals = NetworkProbeSignals()
+
+    def run(self):
+        try:
+            socket.create_connection(("launchermeta.mojang.com", 443), timeout=1).close()
+            online = True
+        except OSError:
+            online = False
+        self.signals.result.emit(online)
+
+
+class RemoteVersionsSignals(QObject):
+    result = Signal(int, object)
+
+
+class ConfigSaveTask(QRunnable):
+    def __init__(self, username, jvm_args, java_path):
+        super().__init__()
+        self.config = (username, list(jvm_args or []), java_path)
+        self.seq = _next_config_seq()
+
+    def run(self):
+        save_config(*self.config, seq=self.seq)
+
+
 class AsphaltLauncher(QWidget):
     def __init__(self):
         super().__init__()
         self.appdata_dir = get_appdata_path()
-        self.icon_path = resource_path("assets/icon.ico")
         self.cfg = load_config()
         self.java_executable = self.cfg.get("java_path")
         self.jvm_arguments = self.cfg.get("jvm_args", ["-Xms2G", "-Xmx4G"])
+        self._settings_dlg = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._flush_config)
         
         self.setWindowTitle("Asphalt Launcher")
         self.setFixedSize(880, 520)
-        self.setWindowIcon(QIcon(self.icon_path))
+        self.setWindowIcon(_icon("assets/icon.ico"))
         
         bg_path = resource_path("assets/background.svg")
         if os.path.isfile(bg_path):
@@ -275,14 +509,13 @@ class AsphaltLauncher(QWidget):
         top_bar = QHBoxLayout()
         top_bar.setContentsMargins(16, 12, 16, 8)
         
-        saved = load_config()
         self.login_lbl = QLabel()
         self.login_lbl.setFixedWidth(300)
         self.login_lbl.setStyleSheet("color:#ffffff; font-size:12px; font-weight:bold;")
         self.login_lbl.setAttribute(Qt.WA_StyledBackground, True)
         
-        if saved.get("username"):
-            self.login_lbl.setText(f"Logged in as {saved['username']}")
+        if self.username:
+            self.login_lbl.setText(f"Logged in as {self.username}")
             self.login_lbl.show()
         else:
             self.login_lbl.hide()
@@ -291,7 +524,7 @@ class AsphaltLauncher(QWidget):
         top_bar.addStretch()
         
         self.btn_account = QPushButton()
-        self.btn_account.setIcon(QIcon(resource_path("assets/account.svg")))
+        self.btn_account.setIcon(_icon("assets/account.svg"))
         self.btn_account.setIconSize(QSize(20, 20))
         self.btn_account.setFixedSize(28, 28)
         self.btn_account.setStyleSheet(
@@ -302,7 +535,7 @@ class AsphaltLauncher(QWidget):
         top_bar.addWidget(self.btn_account)
         
         self.btn_settings = QPushButton()
-        self.btn_settings.setIcon(QIcon(resource_path("assets/settings.svg")))
+        self.btn_settings.setIcon(_icon("assets/settings.svg"))
         self.btn_settings.setIconSize(QSize(20, 20))
         self.btn_settings.setFixedSize(28, 28)
         self.btn_settings.setStyleSheet(
@@ -325,6 +558,11 @@ class AsphaltLauncher(QWidget):
         self.version_dropdown = QComboBox()
         self.version_map = {}
         self._online = True
+        self._local_versions = {}
+        self._remote_versions = []
+        self._populate_gen = 0
+        self._versions_signals = RemoteVersionsSignals()
+        self._versions_signals.result.connect(self._on_remote_versions)
         
         self.version_dropdown.setFixedWidth(220)
         self.version_dropdown.setFixedHeight(42)
@@ -335,7 +573,7 @@ class AsphaltLauncher(QWidget):
         )
         
         self.retry_btn = QPushButton()
-        self.retry_btn.setIcon(QIcon(resource_path("assets/retry.svg")))
+        self.retry_btn.setIcon(_icon("assets/retry.svg"))
         self.retry_btn.setIconSize(QSize(20, 20))
         self.retry_btn.setFixedSize(28, 42)
         self.retry_btn.setToolTip("Refresh version list")
@@ -347,28 +585,6 @@ class AsphaltLauncher(QWidget):
         self.retry_btn.clicked.connect(self._populate_dropdown)
         self.retry_btn.hide()
         
-        try:
-            versions = get_available_versions()
-            self.retry_btn.hide()
-        except Exception:
-            versions = [(f"🔧 {v}", v) for v in _scan_local_versions()]
-            self.retry_btn.show()
-        
-        most_recent_index = 0
-        for idx, (label, version_id) in enumerate(versions):
-            self.version_dropdown.addItem(label)
-            self.version_map[label] = version_id
-            if label.startswith("🔧") and most_recent_index == 0:
-                most_recent_index = idx
-        
-        self.version_dropdown.setCurrentIndex(most_recent_index)
-        
-        last = load_last_played()
-        if last:
-            last_vid = max(last, key=last.get)
-            idx = next((i for i, (_, vid) in enumerate(versions) if vid == last_vid), 0)
-            self.version_dropdown.setCurrentIndex(idx)
-        
         self.start_btn = QPushButton("START")
         self.start_btn.setFixedSize(80, 42)
         self.start_btn.setStyleSheet(
@@ -391,11 +607,14 @@ class AsphaltLauncher(QWidget):
         root_v.addLayout(center_h)
         root_v.addStretch()
         
+        self.version_dropdown.addItem("Loading versions…")
+        self.start_btn.setEnabled(False)
         self._populate_dropdown()
         
-        from PySide6.QtCore import QTimer
+        self._probe_running = False
+        self._last_probe = 0.0
         self._network_timer = QTimer(self)
-        self._network_timer.setInterval(3000)
+        self._network_timer.setInterval(NETWORK_CHECK_INTERVAL)
         self._network_timer.timeout.connect(self._check_network)
         self._network_timer.start()
         
@@ -404,15 +623,34 @@ class AsphaltLauncher(QWidget):
         footer.setStyleSheet("color:#fff; font-size:14px; font-weight:bold; margin-bottom: 12px;")
         root_v.addWidget(footer)
 
+    @property
+    def username(self):
+        return self.cfg.get("username", "")
+
+    def queue_config_save(self):
+        self._save_timer.start()
+
+    def _flush_config(self):
+        QThreadPool.globalInstance().start(
+            ConfigSaveTask(self.username, self.jvm_arguments, self.java_executable))
+
+    def closeEvent(self, event):
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            save_config(self.username, self.jvm_arguments, self.java_executable)
+        super().closeEvent(event)
+
     def open_settings(self):
-        SettingsDialog(self, self.java_executable, self.jvm_arguments).exec()
+        if self._settings_dlg is None:
+            self._settings_dlg = SettingsDialog(self, self.java_executable, self.jvm_arguments)
+        self._settings_dlg.exec()
 
     def open_account_popup(self):
         dlg = QDialog(self)
         dlg.setWindowTitle("Account")
         dlg.setFixedSize(300, 160)
         dlg.setModal(True)
-        dlg.setStyleSheet("font-family: 'Segoe UI'; font-size: 12px;")
+        dlg.setStyleSheet(_ACCOUNT_DLG_QSS)
 
         # Main layout
         layout = QVBoxLayout(dlg)
@@ -420,12 +658,12 @@ class AsphaltLauncher(QWidget):
         layout.setSpacing(12)
 
         layout.addWidget(QLabel("Username:"))
-        username_edit = QLineEdit(load_config().get("username", ""))
+        username_edit = QLineEdit(self.username)
         username_edit.setFixedHeight(28)
         username_edit.setStyleSheet(
             "background:#ffffff; border:1px solid #aaa; border-radius:4px; padding:4px 8px;"
         )
-        username_edit.setReadOnly(bool(load_config().get("username")))
+        username_edit.setReadOnly(bool(self.username))
         username_edit.mousePressEvent = lambda _, e=username_edit: e.setReadOnly(False)
         layout.addWidget(username_edit)
 
@@ -435,33 +673,16 @@ class AsphaltLauncher(QWidget):
 
         save_btn = QPushButton("Save & Exit")
         save_btn.setFixedSize(90, 28)
-        save_btn.setStyleSheet("background:#888888; color:#000; border:none; border-radius:4px;")
+        save_btn.setObjectName("darkBtn")
         save_btn.clicked.connect(dlg.accept)
 
         logout_btn = QPushButton("Logout")
         logout_btn.setFixedSize(90, 28)
-        logout_btn.setStyleSheet("background:#888888; color:#000; border:none; border-radius:4px;")
-
-        for btn in [save_btn, logout_btn]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(0, 0, 0, 120);
-                    color: #ffffff;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 6px;
-                }
-                QPushButton:hover {
-                    background: rgba(0, 0, 0, 160);
-                }
-                QPushButton:pressed {
-                    background: rgba(0, 0, 0, 200);
-                }
-            """)
+        logout_btn.setObjectName("darkBtn")
 
         def do_logout():
             save_config("", self.jvm_arguments, self.java_executable)
+            self.cfg["username"] = ""
             self.current_username = ""
             self.login_lbl.hide()
             dlg.reject()
@@ -475,6 +696,7 @@ class AsphaltLauncher(QWidget):
         if dlg.result() == QDialog.Accepted:
             username = username_edit.text().strip()
             save_config(username, self.jvm_arguments, self.java_executable)
+            self.cfg["username"] = username
             self.current_username = username
             self.login_lbl.setText(f"Logged in as {username}")
             self.login_lbl.show()
@@ -483,81 +705,97 @@ class AsphaltLauncher(QWidget):
         dlg = JvmArgsDialog(self, self.jvm_arguments)
         if dlg.exec():
             self.jvm_arguments = dlg.args()
-            save_config(self.username_input.text(), self.jvm_arguments, self.java_executable)
+            save_config(self.username, self.jvm_arguments, self.java_executable)
 
     def select_java(self):
         dlg = JavaPickerDialog(self, self.java_executable or "")
         if dlg.exec():
             self.java_executable = dlg.java_path()
-            save_config(self.username_input.text(), self.jvm_arguments, self.java_executable)
+            save_config(self.username, self.jvm_arguments, self.java_executable)
 
     def open_folder(self, path):
         if os.path.isdir(path):
             os.startfile(path)
 
     def _populate_dropdown(self):
-        old_text = self.version_dropdown.currentText()
-        self.version_dropdown.clear()
+        self._populate_gen += 1
+        gen = self._populate_gen
+        remote_future = _IO_POOL.submit(_cached_remote_versions)
+        self._local_versions = _scan_local_versions()
+        remote_future.add_done_callback(
+            lambda f: self._versions_signals.result.emit(gen, None if f.exception() else f.result()))
+
+    def _on_remote_versions(self, gen, remote):
+        if gen != self._populate_gen:
+            return
+        if remote is None:
+            self._online = False
+            self.retry_btn.show()
+            remote = []
+        else:
+            self.retry_btn.setVisible(not self._online)
+        self._remote_versions = remote
+        self._fill_dropdown(self._local_versions, remote)
+
+    def _refresh_local_versions(self):
+        self._local_versions = _scan_local_versions()
+        self._fill_dropdown(self._local_versions, self._remote_versions)
+
+    def _fill_dropdown(self, local, remote):
+        old_vid = self.version_map.get(self.version_dropdown.currentText())
         self.version_map.clear()
+        labels = []
+        vid_to_idx = {}
+
+        def add(label, vid):
+            vid_to_idx[vid] = len(labels)
+            labels.append(label)
+            self.version_map[label] = vid
 
-        local = _scan_local_versions()
         for v in local:
-            label = f"🔧 {v}"
-            self.version_dropdown.addItem(label)
-            self.version_map[label] = v
-
-        if self._online:
-            try:
-                remote = minecraft_launcher_lib.utils.get_version_list()
-                type_labels = {"release": "Release", "snapshot": "Snapshot",
-                               "old_beta": "Beta", "old_alpha": "Alpha"}
-                seen = set(local)
-                for v in remote:
-                    vid = v["id"]
-                    if vid in seen:
-                        continue
-                    seen.add(vid)
-                    label = f"{type_labels.get(v['type'], v['type'])} - {vid}"
-                    self.version_dropdown.addItem(label)
-                    self.version_map[label] = vid
-                self.retry_btn.hide()
-            except Exception:
-                self._online = False
-                self.retry_btn.show()
-        else:
-            self.retry_btn.show()
+            add(f"🔧 {v}", v)
+        for label, vid in _remote_items(remote, vid_to_idx):
+            add(label, vid)
 
-        idx = self.version_dropdown.findText(old_text)
-        if idx != -1:
-            self.version_dropdown.setCurrentIndex(idx)
+        self.version_dropdown.blockSignals(True)
+        self.version_dropdown.clear()
+        self.version_dropdown.addItems(labels)
+        self.version_dropdown.blockSignals(False)
 
+        idx = vid_to_idx.get(old_vid)
         last_played = load_last_played()
         if last_played:
-            last_vid = max(last_played, key=last_played.get)
-            for i in range(self.version_dropdown.count()):
-                if self.version_map[self.version_dropdown.itemText(i)] == last_vid:
-                    self.version_dropdown.setCurrentIndex(i)
-                    break
+            last_idx = vid_to_idx.get(max(last_played, key=last_played.get))
+            if last_idx is not None:
+                idx = last_idx
+        if idx is not None:
+            self.version_dropdown.setCurrentIndex(idx)
+        self.start_btn.setEnabled(True)
 
     def _check_network(self):
-        import socket
-        new_state = True
-        try:
-            socket.create_connection(("launchermeta.mojang.com", 443), timeout=1)
-        except Exception:
-            new_state = False
+        if self._probe_running or time.monotonic() - self._last_probe < NETWORK_PROBE_CACHE_SECS:
+            return
+        self._probe_running = True
+        self._last_probe = time.monotonic()
+        probe = NetworkProbe()
+        probe.signals.result.connect(self._on_network_result)
+        QThreadPool.globalInstance().start(probe)
+
+    def _on_network_result(self, new_state):
+        self._probe_running = False
+        if new_state:
+            self._network_timer.setInterval(NETWORK_CHECK_INTERVAL)
+        else:
+            self._network_timer.setInterval(
+                min(self._network_timer.interval() * 2, NETWORK_CHECK_MAX_INTERVAL))
         if new_state != self._online:
             self._online = new_state
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(0, self._populate_dropdown)
+            self._populate_dropdown()
 
     def launch_game(self):
-        self._populate_dropdown()
-        self._online = None
-
         username = getattr(self, 'current_username', '').strip()
         if not username:
-            username = load_config().get("username", "")
+            username = self.username
         selected_label = self.version_dropdown.currentText()
         version_id = self.version_map[selected_label]
 
@@ -576,11 +814,9 @@ class AsphaltLauncher(QWidget):
             return
 
         save_config(username, self.jvm_arguments, self.java_executable)
+        self.cfg["username"] = username
         mc_dir = get_minecraft_dir()
-        version_dir = os.path.join(mc_dir, "versions", version_id)
-        json_file = os.path.join(version_dir, f"{version_id}.json")
-        jar_file = os.path.join(version_dir, f"{version_id}.jar")
-        already_installed = os.path.isfile(json_file) and os.path.isfile(jar_file)
+        already_installed = _is_installed(mc_dir, version_id)
 
         if not already_installed:
             from PySide6.QtCore import QThread
@@ -616,11 +852,14 @@ class AsphaltLauncher(QWidget):
         try:
             launch_minecraft(username, version_id,
                              java_executable=self.java_executable,
-                             jvm_args=self.jvm_arguments)
+                             jvm_args=self.jvm_arguments,
+                             install_if_missing=False)
         except Exception as e:
             print(f"Launch failed: {e}")
         finally:
             self.show()
+            if not already_installed:
+                self._refresh_local_versions()
 
 
 class SettingsDialog(QDialog):
@@ -631,6 +870,7 @@ class SettingsDialog(QDialog):
         self.setModal(True)
         self.parent_window = parent
         self.jvm_arguments = list(jvm_arguments or [])
+        self._credits_dlg = None
         
         self.min_spin = QSpinBox()
         self.min_spin.setRange(512, 64 * 1024)
@@ -701,9 +941,6 @@ class SettingsDialog(QDialog):
         btn_mc = QPushButton(".minecraft")
         btn_launcher = QPushButton("Launcher Dir")
         
-        for btn in (btn_jvm, btn_java, btn_mc, btn_launcher):
-            btn.setStyleSheet("background-color: #888888; padding: 8px; font-size: 12px;")
-        
         btn_grid = QGridLayout()
         btn_grid.addWidget(btn_jvm, 0, 0)
         btn_grid.addWidget(btn_java, 0, 1)
@@ -711,45 +948,14 @@ class SettingsDialog(QDialog):
         btn_grid.addWidget(btn_launcher, 1, 1)
         
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet("background-color: #888888; padding: 8px; font-size: 12px;")
         close_btn.clicked.connect(self.accept)
         
         credits_btn = QPushButton("Credits")
-        credits_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(0, 0, 0, 120);
-                color: #ffffff;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background: rgba(0, 0, 0, 160);
-            }
-            QPushButton:pressed {
-                background: rgba(0, 0, 0, 200);
-            }
-        """)
         credits_btn.clicked.connect(self._show_credits)
 
-        for btn in [btn_jvm, btn_java, btn_mc, btn_launcher, close_btn]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(0, 0, 0, 120);
-                    color: #ffffff;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-                QPushButton:hover {
-                    background: rgba(0, 0, 0, 160);
-                }
-                QPushButton:pressed {
-                    background: rgba(0, 0, 0, 200);
-                }
-            """)
+        for btn in (btn_jvm, btn_java, btn_mc, btn_launcher, close_btn, credits_btn):
+            btn.setObjectName("darkBtn")
+        self.setStyleSheet(_DARK_BTN_QSS)
         
         main = QVBoxLayout(self)
         main.addLayout(grid)
@@ -763,54 +969,40 @@ class SettingsDialog(QDialog):
         btn_launcher.clicked.connect(lambda: self.parent_window.open_folder(self.parent_window.appdata_dir))
 
     def _load_ram_from_args(self):
-        for arg in self.jvm_arguments:
-            if arg.startswith("-Xms"):
-                mb = int(arg[4:-1]) if arg.endswith("M") else int(arg[4:-1]) * 1024
-                self.min_spin.setValue(mb)
-                self.min_slider.setValue(mb)
-            elif arg.startswith("-Xmx"):
-                mb = int(arg[4:-1]) if arg.endswith("M") else int(arg[4:-1]) * 1024
-                self.max_spin.setValue(mb)
-                self.max_slider.setValue(mb)
+        xms, xmx, _ = _split_xms_xmx(self.jvm_arguments)
+        if xms is not None:
+            self.min_spin.setValue(xms)
+            self.min_slider.setValue(xms)
+        if xmx is not None:
+            self.max_spin.setValue(xmx)
+            self.max_slider.setValue(xmx)
 
     def _write_ram_to_args(self):
-        new_args = [a for a in self.jvm_arguments if not (a.startswith("-Xms") or a.startswith("-Xmx"))]
+        _, _, new_args = _split_xms_xmx(self.jvm_arguments)
         new_args.append(f"-Xms{self.min_spin.value()}M")
         new_args.append(f"-Xmx{self.max_spin.value()}M")
         self.jvm_arguments = new_args
         self.parent_window.jvm_arguments = new_args
-        save_config(
-            load_config().get("username", ""),
-            self.jvm_arguments,
-            self.parent_window.java_executable
-        )
+        self.parent_window.queue_config_save()
 
     def _open_jvm_dialog(self):
         dlg = JvmArgsDialog(self, self.jvm_arguments)
         if dlg.exec():
             self.jvm_arguments = dlg.args()
             self.parent_window.jvm_arguments = self.jvm_arguments
-            save_config(
-                load_config().get("username", ""),
-                self.jvm_arguments,
-                self.parent_window.java_executable
-            )
+            self.parent_window.queue_config_save()
             self._load_ram_from_args()
 
     def _open_java_dialog(self):
         dlg = JavaPickerDialog(self, self.parent_window.java_executable or "")
         if dlg.exec():
             self.parent_window.java_executable = dlg.java_path()
-            save_config(
-                load_config().get("username", ""),
-                self.jvm_arguments,
-                self.parent_window.java_executable
-            )
+            self.parent_window.queue_config_save()
 
     def _show_credits(self):
-        from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QDialog, QLabel, QPushButton
-        from PySide6.QtGui import QDesktopServices
-        from PySide6.QtCore import QUrl, Qt
+        if self._credits_dlg is not None:
+            self._credits_dlg.exec()
+            return
 
         dlg = QDialog(self)
         dlg.setWindowTitle("Credits")
@@ -821,41 +1013,13 @@ class SettingsDialog(QDialog):
         label.setWordWrap(True)
         label.setOpenExternalLinks(True)
         label.setTextFormat(Qt.RichText)
-        label.setText(
-            "<strong>Asphalt Launcher - A Launcher for Minecraft</strong><br>"
-            "An open-source and minimal Minecraft launcher built using Python<br><br>"
-            '<a href="https://github.com/arsalanvally/Asphalt-Launcher">GitHub</a> • '
-            '<a href="https://github.com/arsalanvally/Asphalt-Launcher/blob/main/README.md">README</a> • '
-            '<a href="https://github.com/arsalanvally/Asphalt-Launcher/blob/main/LICENSE">LICENSE</a> • '
-            '<a href="https://github.com/arsalanvally/Asphalt-Launcher/blob/main/BUILD.md">BUILD</a> • '
-            '<a href="https://github.com/arsalanvally/Asphalt-Launcher/blob/main/FAQ.md">FAQ</a><br><br>'
-            "If you find this useful, <strong>please consider giving credit</strong> by linking to my GitHub page—"
-            "it's not required, but it would be <strong>greatly appreciated.</strong><br>"
-            "You're <strong>free</strong> to <strong>modify</strong> and <strong>redistribute</strong> this <strong>without</strong> any <strong>restrictions.</strong>"
-        )
+        label.setText(_CREDITS_HTML)
         label.setStyleSheet("font-family: 'Segoe UI'; font-size: 12px; padding: 8px;")
 
         github_btn = QPushButton("GitHub")
         thanks_btn = QPushButton("Thanks")
-
-        style = """
-            QPushButton {
-                background: rgba(0, 0, 0, 120);
-                color: #ffffff;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background: rgba(0, 0, 0, 160);
-            }
-            QPushButton:pressed {
-                background: rgba(0, 0, 0, 200);
-            }
-        """
-        github_btn.setStyleSheet(style)
-        thanks_btn.setStyleSheet(style)
+        github_btn.setObjectName("darkBtn")
+        thanks_btn.setObjectName("darkBtn")
 
         github_btn.clicked.connect(
             lambda: QDesktopServices.openUrl(QUrl("https://github.com/arsalanvally/Asphalt-Launcher"))
@@ -870,6 +1034,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(label)
         layout.addLayout(btn_layout)
 
+        self._credits_dlg = dlg
         dlg.exec()
 
 